@@ -38,21 +38,31 @@ from typing import Optional, Dict, Any
 import struct
 import atexit
 import os
+import json
+import operator
 
 import zmq
-from lxml import etree
-import xml.sax.saxutils
-
-from cryptography.hazmat.primitives.serialization import pkcs12
-from cryptography.hazmat.primitives import serialization
 
 from tak_client import TAKClient
 from tak_udp_client import TAKUDPClient
-from drone import Drone
+from drone import Drone, NEVER_SENT
 from system_status import SystemStatus
 from manager import DroneManager
 from messaging import CotMessenger
-from utils import load_config, validate_config, get_str, get_int, get_float, get_bool
+from utils import AppConfig, load_config, validate_config, get_str, get_int, get_float, get_bool
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson parses bytes directly and is several times faster than the stdlib decoder
+json_loads = orjson.loads if orjson else json.loads
 
 # Setup logging
 def setup_logging(debug: bool):
@@ -71,11 +81,45 @@ def setup_logging(debug: bool):
 
 logger = logging.getLogger(__name__)
 
+# Basic ID types that carry a usable drone identifier, mapped to their log label
+ID_TYPE_LABELS = {
+    'Serial Number (ANSI/CTA-2063-A)': 'Serial Number',
+    'CAA Assigned Registration ID': 'CAA Assigned',
+}
+
+# Multiplier converting the byte counts in status messages to MB
+MB_PER_BYTE = 1.0 / (1024 * 1024)
+
+# Leading bytes of a MessagePack map or array; a JSON document never starts with these
+MSGPACK_LEAD_BYTES = frozenset(range(0x80, 0xa0)) | {0xdc, 0xdd, 0xde, 0xdf}
+
+# Most messages read from one socket per poll wakeup; the poll reports the socket
+# ready again straight away, so drone updates still run during a sustained burst
+MAX_DRAIN = 256
+
+def decode_message(frame: bytes) -> Any:
+    """Decodes a ZMQ frame, detecting MessagePack payloads by their first byte and falling back to JSON."""
+    if msgpack and frame and frame[0] in MSGPACK_LEAD_BYTES:
+        return msgpack.unpackb(frame, raw=False)
+    return json_loads(frame)
+
+def _remove_files(paths):
+    """Removes the given files, ignoring any that are already gone."""
+    for path in paths:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
 def setup_tls_context(tak_tls_p12: str, tak_tls_p12_pass: Optional[str], tak_tls_skip_verify: bool) -> Optional[ssl.SSLContext]:
     """Sets up the TLS context using the provided PKCS#12 file."""
     if not tak_tls_p12:
         return None
 
+    # Imported here so deployments without TLS never load the cryptography backend
+    from cryptography.hazmat.primitives.serialization import pkcs12
+    from cryptography.hazmat.primitives import serialization
+
     try:
         with open(tak_tls_p12, 'rb') as p12_file:
             p12_data = p12_file.read()
@@ -118,10 +162,8 @@ def setup_tls_context(tak_tls_p12: str, tak_tls_p12_pass: Optional[str], tak_tls
     cert_temp.close()
     ca_temp.close()
 
-    # Register cleanup
-    atexit.register(os.unlink, key_temp_path)
-    atexit.register(os.unlink, cert_temp_path)
-    atexit.register(os.unlink, ca_temp_path)
+    # Register a single cleanup for all three files
+    atexit.register(_remove_files, [key_temp_path, cert_temp_path, ca_temp_path])
 
     try:
         tls_context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
@@ -132,11 +174,228 @@ def setup_tls_context(tak_tls_p12: str, tak_tls_p12_pass: Optional[str], tak_tls
             tls_context.check_hostname = False
             tls_context.verify_mode = ssl.CERT_NONE
     except Exception as e:
-        logger.critical(f"Failed to set up TLS context: {e}")
+        logger.critical("Failed to set up TLS context: %s", e)
         sys.exit(1)
 
     return tls_context
 
+def parse_drone_info(message: Any) -> Optional[Dict[str, Any]]:
+    """Extracts drone fields from a decoded telemetry message; returns None if the format is unknown."""
+    drone_info = {}
+
+    # Check if message is a list (original format) or dict (ESP32 format)
+    if isinstance(message, list):
+        # Original format: list of dictionaries
+        for item in message:
+            if isinstance(item, dict):
+                # Process each item as a dictionary
+                if 'MAC' in item:
+                    drone_info['mac'] = item['MAC']
+                if 'RSSI' in item:
+                    drone_info['rssi'] = item['RSSI']
+
+                if 'Basic ID' in item:
+                    basic_id = item['Basic ID']
+                    drone_info['mac'] = basic_id.get('MAC')
+                    drone_info['rssi'] = basic_id.get('RSSI')
+                    id_label = ID_TYPE_LABELS.get(basic_id.get('id_type'))
+                    if id_label and 'id' not in drone_info:
+                        drone_info['id'] = basic_id.get('id', 'unknown')
+                        logger.debug("Parsed %s ID: %s", id_label, drone_info['id'])
+
+                # Process location/vector messages
+                if 'Location/Vector Message' in item:
+                    drone_info['lat'] = get_float(item['Location/Vector Message'].get('latitude', 0.0))
+                    drone_info['lon'] = get_float(item['Location/Vector Message'].get('longitude', 0.0))
+                    drone_info['speed'] = get_float(item['Location/Vector Message'].get('speed', 0.0))
+                    drone_info['vspeed'] = get_float(item['Location/Vector Message'].get('vert_speed', 0.0))
+                    drone_info['alt'] = get_float(item['Location/Vector Message'].get('geodetic_altitude', 0.0))
+                    drone_info['height'] = get_float(item['Location/Vector Message'].get('height_agl', 0.0))
+
+                # Process Self-ID messages
+                if 'Self-ID Message' in item:
+                    drone_info['description'] = item['Self-ID Message'].get('text', "")
+
+                # Process System messages
+                if 'System Message' in item:
+                    drone_info['pilot_lat'] = get_float(item['System Message'].get('latitude', 0.0))
+                    drone_info['pilot_lon'] = get_float(item['System Message'].get('longitude', 0.0))
+                    drone_info['home_lat']  = get_float(item['System Message'].get('home_lat', 0.0))
+                    drone_info['home_lon']  = get_float(item['System Message'].get('home_lon', 0.0))
+            else:
+                logger.error("Unexpected item type in message list; expected dict.")
+
+    elif isinstance(message, dict):
+        if "AUX_ADV_IND" in message:
+            # Get RSSI from raw message
+            if "rssi" in message["AUX_ADV_IND"]:
+                drone_info['rssi'] = message["AUX_ADV_IND"]["rssi"]
+            # Get MAC from raw message
+            if "aext" in message and "AdvA" in message["aext"]:
+                mac = message["aext"]["AdvA"].split()[0]  # Extract MAC before " (Public)"
+                drone_info['mac'] = mac
+
+        # ESP32 format: single dictionary
+        if 'Basic ID' in message:
+            basic_id = message['Basic ID']
+            drone_info['mac'] = basic_id.get('MAC')
+            drone_info['rssi'] = basic_id.get('RSSI')
+            id_label = ID_TYPE_LABELS.get(basic_id.get('id_type'))
+            if id_label and 'id' not in drone_info:
+                drone_info['id'] = basic_id.get('id', 'unknown')
+                logger.debug("Parsed %s ID: %s", id_label, drone_info['id'])
+
+        # Process location/vector messages
+        if 'Location/Vector Message' in message:
+            drone_info['lat'] = get_float(message['Location/Vector Message'].get('latitude', 0.0))
+            drone_info['lon'] = get_float(message['Location/Vector Message'].get('longitude', 0.0))
+            drone_info['speed'] = get_float(message['Location/Vector Message'].get('speed', 0.0))
+            drone_info['vspeed'] = get_float(message['Location/Vector Message'].get('vert_speed', 0.0))
+            drone_info['alt'] = get_float(message['Location/Vector Message'].get('geodetic_altitude', 0.0))
+            drone_info['height'] = get_float(message['Location/Vector Message'].get('height_agl', 0.0))
+
+        # Process Self-ID messages
+        if 'Self-ID Message' in message:
+            drone_info['description'] = message['Self-ID Message'].get('text', "")
+
+        # Process System messages
+        if 'System Message' in message:
+            drone_info['pilot_lat'] = get_float(message['System Message'].get('operator_lat', 0.0))
+            drone_info['pilot_lon'] = get_float(message['System Message'].get('operator_lon', 0.0))
+
+    else:
+        logger.error("Unexpected message format; expected dict or list.")
+        return None
+
+    return drone_info
+
+def handle_telemetry(message: Any, drone_manager: DroneManager):
+    """Updates or adds the drone described by a decoded telemetry message."""
+    drone_info = parse_drone_info(message)
+    if drone_info is None:
+        return
+
+    # Enforce 'drone-' prefix once after parsing all IDs
+    if 'id' in drone_info:
+        if not drone_info['id'].startswith('drone-'):
+            drone_info['id'] = f"drone-{drone_info['id']}"
+            logger.debug("Ensured drone id with prefix: %s", drone_info['id'])
+        else:
+            logger.debug("Drone id already has prefix: %s", drone_info['id'])
+
+        drone_id = drone_info['id']
+        drone = drone_manager.drones.get(drone_id)
+        if drone is not None:
+            drone.apply(drone_info)
+            logger.debug("Updated drone: %s", drone_id)
+        else:
+            drone_manager.update_or_add_drone(drone_id, Drone.from_info(drone_id, drone_info))
+            logger.debug("Added new drone: %s", drone_id)
+    else:
+        logger.warning("Drone ID not found in message. Skipping.")
+
+def _fields(*keys: str):
+    """Pairs field names with a C-level getter that fetches them all at once."""
+    return keys, operator.itemgetter(*keys)
+
+_GPS_FIELDS = _fields('latitude', 'longitude', 'altitude')
+_STATS_FIELDS = _fields('cpu_usage', 'temperature', 'uptime')
+_MEMORY_FIELDS = _fields('total', 'available')
+_DISK_FIELDS = _fields('total', 'used')
+
+def _read_floats(data: Dict[str, Any], fields) -> list:
+    """Returns the given fields of a dict as floats, using 0.0 for any that are missing."""
+    keys, getter = fields
+    try:
+        values = getter(data)
+    except KeyError:
+        values = [data.get(key, 0.0) for key in keys]
+    return [get_float(value) for value in values]
+
+def _sdr_temp(value: Any) -> Optional[float]:
+    """Returns an AntSDR temperature as a float, or None when it is not reported."""
+    if value is None or value == 'N/A':
+        return None
+    return get_float(value, None)
+
+def handle_status(
+    status_message: Dict[str, Any],
+    drone_manager: DroneManager,
+    last_sent: Dict[str, Any],
+    resend_interval: float
+):
+    """Builds the system status CoT for a decoded status message and queues it for sending.
+
+    ``last_sent`` holds the fingerprint and time of the previous send; an
+    unchanged status is skipped until ``resend_interval`` seconds have passed.
+    """
+    status_get = status_message.get
+
+    serial_number = status_get('serial_number', 'unknown')
+    lat, lon, alt = _read_floats(status_get('gps_data', {}), _GPS_FIELDS)
+
+    system_stats = status_get('system_stats', {})
+    ant_sdr_temps = status_get('ant_sdr_temps', {})
+    pluto_temp = _sdr_temp(ant_sdr_temps.get('pluto_temp'))
+    zynq_temp = _sdr_temp(ant_sdr_temps.get('zynq_temp'))
+
+    # Extract system statistics with defaults
+    cpu_usage, temperature, uptime = _read_floats(system_stats, _STATS_FIELDS)
+    memory_total, memory_available = _read_floats(system_stats.get('memory', {}), _MEMORY_FIELDS)
+    disk_total, disk_used = _read_floats(system_stats.get('disk', {}), _DISK_FIELDS)
+    memory_total *= MB_PER_BYTE
+    memory_available *= MB_PER_BYTE
+    disk_total *= MB_PER_BYTE
+    disk_used *= MB_PER_BYTE
+
+    if lat == 0.0 and lon == 0.0:
+        logger.warning(
+            "Latitude and longitude are missing or zero. "
+            "Proceeding with CoT message using [0.0, 0.0]."
+        )
+
+    # Stationary kits report near-identical status; only resend it periodically
+    fingerprint = (
+        serial_number, round(lat, 6), round(lon, 6), round(alt, 1), round(cpu_usage, 1), temperature
+    )
+    now = time.monotonic()  # Immune to wall-clock steps from NTP or GPS time sync
+    if fingerprint == last_sent.get('fingerprint') and now - last_sent.get('sent_at', NEVER_SENT) < resend_interval:
+        logger.debug("System status unchanged. Skipping CoT message.")
+        return
+    last_sent['fingerprint'] = fingerprint
+    last_sent['sent_at'] = now
+
+    system_status = SystemStatus(
+        serial_number=serial_number,
+        lat=lat,
+        lon=lon,
+        alt=alt,
+        cpu_usage=cpu_usage,
+        memory_total=memory_total,
+        memory_available=memory_available,
+        disk_total=disk_total,
+        disk_used=disk_used,
+        temperature=temperature,
+        uptime=uptime,
+        pluto_temp=pluto_temp,
+        zynq_temp=zynq_temp
+    )
+
+    cot_xml = system_status.to_cot_xml()
+
+    # Sent by DroneManager's dispatch thread along with the drone updates
+    drone_manager.enqueue_cot(system_status.id, cot_xml)
+    logger.info("Queued system status CoT message for TAK/multicast.")
+
+def recv_pending(sock: zmq.Socket, limit: int = MAX_DRAIN):
+    """Yields up to ``limit`` messages already queued on a socket without blocking."""
+    for _ in range(limit):
+        try:
+            frame = sock.recv(zmq.NOBLOCK)
+        except zmq.Again:
+            return
+        yield decode_message(frame)
+
 def zmq_to_cot(
     zmq_host: str,
     zmq_port: int,
@@ -159,14 +418,14 @@ def zmq_to_cot(
     telemetry_socket = context.socket(zmq.SUB)
     telemetry_socket.connect(f"tcp://{zmq_host}:{zmq_port}")
     telemetry_socket.setsockopt_string(zmq.SUBSCRIBE, "")
-    logger.debug(f"Connected to telemetry ZMQ socket at tcp://{zmq_host}:{zmq_port}")
+    logger.debug("Connected to telemetry ZMQ socket at tcp://%s:%s", zmq_host, zmq_port)
 
     # Only create and connect the status_socket if zmq_status_port is provided
     if zmq_status_port:
         status_socket = context.socket(zmq.SUB)
         status_socket.connect(f"tcp://{zmq_host}:{zmq_status_port}")
         status_socket.setsockopt_string(zmq.SUBSCRIBE, "")
-        logger.debug(f"Connected to status ZMQ socket at tcp://{zmq_host}:{zmq_status_port}")
+        logger.debug("Connected to status ZMQ socket at tcp://%s:%s", zmq_host, zmq_status_port)
     else:
         status_socket = None
         logger.debug("No ZMQ status port provided. Skipping status socket setup.")
@@ -182,7 +441,7 @@ def zmq_to_cot(
         elif tak_protocol == 'UDP':
             tak_udp_client = TAKUDPClient(tak_host, tak_port)
         else:
-            logger.critical(f"Unsupported TAK protocol: {tak_protocol}. Must be 'TCP' or 'UDP'.")
+            logger.critical("Unsupported TAK protocol: %s. Must be 'TCP' or 'UDP'.", tak_protocol)
             sys.exit(1)
 
     # Initialize CotMessenger
@@ -206,6 +465,7 @@ def zmq_to_cot(
     def signal_handler(sig, frame):
         """Handles signal interruptions for graceful shutdown."""
         logger.info("Interrupted by user")
+        drone_manager.close()
         telemetry_socket.close()
         if status_socket:
             status_socket.close()
@@ -217,226 +477,94 @@ def zmq_to_cot(
             tak_udp_client.close()
         if cot_messenger:
             cot_messenger.close()
+        signal.set_wakeup_fd(-1)
+        wakeup_r.close()
+        wakeup_w.close()
         logger.info("Cleaned up ZMQ resources")
         sys.exit(0)
 
+    # Signals write to this socket pair so a blocking poll returns promptly
+    wakeup_r, wakeup_w = socket.socketpair()
+    wakeup_r.setblocking(False)
+    wakeup_w.setblocking(False)
+    signal.set_wakeup_fd(wakeup_w.fileno())
+
     signal.signal(signal.SIGINT, signal_handler)
 
     poller = zmq.Poller()
     poller.register(telemetry_socket, zmq.POLLIN)
     if status_socket:
         poller.register(status_socket, zmq.POLLIN)
+    poller.register(wakeup_r, zmq.POLLIN)
+
+    # While drones are tracked, wake often enough to honour sub-second rate limits
+    # but never more than every 10 ms, and at least once a second
+    update_poll_ms = int(min(max(rate_limit, 0.01), 1.0) * 1000)
+
+    last_status_sent = {}
+    status_resend_interval = rate_limit * 10
 
     try:
         while True:
-            socks = dict(poller.poll(timeout=1000))
-            if telemetry_socket in socks and socks[telemetry_socket] == zmq.POLLIN:
-                logger.debug("Received a message on the telemetry socket")
-                message = telemetry_socket.recv_json()
-                # logger.debug(f"Received telemetry JSON: {message}")
-
-                drone_info = {}
-
-                # Check if message is a list (original format) or dict (ESP32 format)
-                if isinstance(message, list):
-                    # Original format: list of dictionaries
-                    for item in message:
-                        if isinstance(item, dict):
-                            # Process each item as a dictionary
-                            if 'MAC' in item:
-                                drone_info['mac'] = item['MAC']
-                            if 'RSSI' in item:
-                                drone_info['rssi'] = item['RSSI']
-
-                            if 'Basic ID' in item:
-                                id_type = item['Basic ID'].get('id_type')
-                                drone_info['mac'] = item['Basic ID'].get('MAC')
-                                drone_info['rssi'] = item['Basic ID'].get('RSSI')
-                                if id_type == 'Serial Number (ANSI/CTA-2063-A)' and 'id' not in drone_info:
-                                    drone_info['id'] = item['Basic ID'].get('id', 'unknown')
-                                    logger.debug(f"Parsed Serial Number ID: {drone_info['id']}")
-                                elif id_type == 'CAA Assigned Registration ID' and 'id' not in drone_info:
-                                    drone_info['id'] = item['Basic ID'].get('id', 'unknown')
-                                    logger.debug(f"Parsed CAA Assigned ID: {drone_info['id']}")
-
-                            # Process location/vector messages
-                            if 'Location/Vector Message' in item:
-                                drone_info['lat'] = get_float(item['Location/Vector Message'].get('latitude', 0.0))
-                                drone_info['lon'] = get_float(item['Location/Vector Message'].get('longitude', 0.0))
-                                drone_info['speed'] = get_float(item['Location/Vector Message'].get('speed', 0.0))
-                                drone_info['vspeed'] = get_float(item['Location/Vector Message'].get('vert_speed', 0.0))
-                                drone_info['alt'] = get_float(item['Location/Vector Message'].get('geodetic_altitude', 0.0))
-                                drone_info['height'] = get_float(item['Location/Vector Message'].get('height_agl', 0.0))
-
-                            # Process Self-ID messages
-                            if 'Self-ID Message' in item:
-                                drone_info['description'] = item['Self-ID Message'].get('text', "")
-
-                            # Process System messages
-                            if 'System Message' in item:
-                                drone_info['pilot_lat'] = get_float(item['System Message'].get('latitude', 0.0))
-                                drone_info['pilot_lon'] = get_float(item['System Message'].get('longitude', 0.0))
-                                drone_info['home_lat']  = get_float(item['System Message'].get('home_lat', 0.0))
-                                drone_info['home_lon']  = get_float(item['System Message'].get('home_lon', 0.0))
-                        else:
-                            logger.error("Unexpected item type in message list; expected dict.")
-
-                elif isinstance(message, dict):
-                    if "AUX_ADV_IND" in message:
-                        # Get RSSI from raw message
-                        if "rssi" in message["AUX_ADV_IND"]:
-                            drone_info['rssi'] = message["AUX_ADV_IND"]["rssi"]
-                        # Get MAC from raw message
-                        if "aext" in message and "AdvA" in message["aext"]:
-                            mac = message["aext"]["AdvA"].split()[0]  # Extract MAC before " (Public)"
-                            drone_info['mac'] = mac
-
-                    # ESP32 format: single dictionary
-                    if 'Basic ID' in message:
-                        id_type = message['Basic ID'].get('id_type')
-                        drone_info['mac'] = message['Basic ID'].get('MAC')
-                        drone_info['rssi'] = message['Basic ID'].get('RSSI')
-                        if id_type == 'Serial Number (ANSI/CTA-2063-A)' and 'id' not in drone_info:
-                            drone_info['id'] = message['Basic ID'].get('id', 'unknown')
-                            logger.debug(f"Parsed Serial Number ID: {drone_info['id']}")
-                        elif id_type == 'CAA Assigned Registration ID' and 'id' not in drone_info:
-                            drone_info['id'] = message['Basic ID'].get('id', 'unknown')
-                            logger.debug(f"Parsed CAA Assigned ID: {drone_info['id']}")
-
-                    # Process location/vector messages
-                    if 'Location/Vector Message' in message:
-                        drone_info['lat'] = get_float(message['Location/Vector Message'].get('latitude', 0.0))
-                        drone_info['lon'] = get_float(message['Location/Vector Message'].get('longitude', 0.0))
-                        drone_info['speed'] = get_float(message['Location/Vector Message'].get('speed', 0.0))
-                        drone_info['vspeed'] = get_float(message['Location/Vector Message'].get('vert_speed', 0.0))
-                        drone_info['alt'] = get_float(message['Location/Vector Message'].get('geodetic_altitude', 0.0))
-                        drone_info['height'] = get_float(message['Location/Vector Message'].get('height_agl', 0.0))
-
-                    # Process Self-ID messages
-                    if 'Self-ID Message' in message:
-                        drone_info['description'] = message['Self-ID Message'].get('text', "")
-
-                    # Process System messages
-                    if 'System Message' in message:
-                        drone_info['pilot_lat'] = get_float(message['System Message'].get('operator_lat', 0.0))
-                        drone_info['pilot_lon'] = get_float(message['System Message'].get('operator_lon', 0.0))
-
-                else:
-                    logger.error("Unexpected message format; expected dict or list.")
-                    continue  # Skip this message
-
-                # Enforce 'drone-' prefix once after parsing all IDs
-                if 'id' in drone_info:
-                    if not drone_info['id'].startswith('drone-'):
-                        drone_info['id'] = f"drone-{drone_info['id']}"
-                        logger.debug(f"Ensured drone id with prefix: {drone_info['id']}")
-                    else:
-                        logger.debug(f"Drone id already has prefix: {drone_info['id']}")
-
-                    drone_id = drone_info['id']
-                    if drone_id in drone_manager.drone_dict:
-                        drone = drone_manager.drone_dict[drone_id]
-                        drone.update(
-                            mac=drone_info.get('mac', ""),
-                            rssi=drone_info.get('rssi', 0.0),
-                            lat=drone_info.get('lat', 0.0),
-                            lon=drone_info.get('lon', 0.0),
-                            speed=drone_info.get('speed', 0.0),
-                            vspeed=drone_info.get('vspeed', 0.0),
-                            alt=drone_info.get('alt', 0.0),
-                            height=drone_info.get('height', 0.0),
-                            pilot_lat=drone_info.get('pilot_lat', 0.0),
-                            pilot_lon=drone_info.get('pilot_lon', 0.0),
-                            home_lat=drone_info.get('home_lat', 0.0),
-                            home_lon=drone_info.get('home_lon', 0.0),
-                            description=drone_info.get('description', "")
-                        )
-                        logger.debug(f"Updated drone: {drone_id}")
-                    else:
-                        drone = Drone(
-                            id=drone_info['id'],
-                            lat=drone_info.get('lat', 0.0),
-                            lon=drone_info.get('lon', 0.0),
-                            speed=drone_info.get('speed', 0.0),
-                            vspeed=drone_info.get('vspeed', 0.0),
-                            alt=drone_info.get('alt', 0.0),
-                            height=drone_info.get('height', 0.0),
-                            pilot_lat=drone_info.get('pilot_lat', 0.0),
-                            pilot_lon=drone_info.get('pilot_lon', 0.0),
-                            home_lat=drone_info.get('home_lat', 0.0),
-                            home_lon=drone_info.get('home_lon', 0.0),
-                            description=drone_info.get('description', ""),
-                            mac=drone_info.get('mac', ""),
-                            rssi=drone_info.get('rssi', 0)
-                        )
-                        drone_manager.update_or_add_drone(drone_id, drone)
-                        logger.debug(f"Added new drone: {drone_id}")
-                else:
-                    logger.warning("Drone ID not found in message. Skipping.")
-
-            if status_socket and status_socket in socks and socks[status_socket] == zmq.POLLIN:
-                logger.debug("Received a message on the status socket")
-                status_message = status_socket.recv_json()
-                # logger.debug(f"Received system status JSON: {status_message}")
-                
-                serial_number = status_message.get('serial_number', 'unknown')
-                gps_data = status_message.get('gps_data', {})
-                lat = get_float(gps_data.get('latitude', 0.0))
-                lon = get_float(gps_data.get('longitude', 0.0))
-                alt = get_float(gps_data.get('altitude', 0.0))
-
-                system_stats = status_message.get('system_stats', {})
-                ant_sdr_temps = status_message.get('ant_sdr_temps', {})
-                pluto_temp = ant_sdr_temps.get('pluto_temp', 'N/A')
-                zynq_temp  = ant_sdr_temps.get('zynq_temp',  'N/A')
-
-                # Extract system statistics with defaults
-                cpu_usage = get_float(system_stats.get('cpu_usage', 0.0))
-                memory = system_stats.get('memory', {})
-                memory_total = get_float(memory.get('total', 0.0)) / (1024 * 1024)  # Convert bytes to MB
-                memory_available = get_float(memory.get('available', 0.0)) / (1024 * 1024)
-                disk = system_stats.get('disk', {})
-                disk_total = get_float(disk.get('total', 0.0)) / (1024 * 1024)  # Convert bytes to MB
-                disk_used = get_float(disk.get('used', 0.0)) / (1024 * 1024)
-                temperature = get_float(system_stats.get('temperature', 0.0))
-                uptime = get_float(system_stats.get('uptime', 0.0))
-
-                if lat == 0.0 and lon == 0.0:
-                    logger.warning(
-                        "Latitude and longitude are missing or zero. "
-                        "Proceeding with CoT message using [0.0, 0.0]."
-                    )
-
-                system_status = SystemStatus(
-                    serial_number=serial_number,
-                    lat=lat,
-                    lon=lon,
-                    alt=alt,
-                    cpu_usage=cpu_usage,
-                    memory_total=memory_total,
-                    memory_available=memory_available,
-                    disk_total=disk_total,
-                    disk_used=disk_used,
-                    temperature=temperature,
-                    uptime=uptime,
-                    pluto_temp=pluto_temp,
-                    zynq_temp=zynq_temp 
-                )
-
-                cot_xml = system_status.to_cot_xml()
-
-                # Sending CoT message via CotMessenger
-                cot_messenger.send_cot(cot_xml)
-                logger.info(f"Sent CoT message to TAK/multicast.")
+            # Nothing to age out or resend with no drones tracked, so sleep until
+            # a message or signal arrives
+            poll_timeout = update_poll_ms if drone_manager.drones else None
+            socks = dict(poller.poll(timeout=poll_timeout))
+            if wakeup_r in socks:
+                try:
+                    wakeup_r.recv(4096)
+                except BlockingIOError:
+                    pass
+            if telemetry_socket in socks:
+                for message in recv_pending(telemetry_socket):
+                    logger.debug("Received a message on the telemetry socket")
+                    handle_telemetry(message, drone_manager)
+
+            if status_socket and status_socket in socks:
+                # A queued status is superseded by the next one, so only send the newest
+                status_message = None
+                for status_message in recv_pending(status_socket):
+                    logger.debug("Received a message on the status socket")
+                if status_message is not None:
+                    handle_status(status_message, drone_manager, last_status_sent, status_resend_interval)
 
             # Send drone updates via DroneManager
             drone_manager.send_updates()
     except Exception as e:
-        logger.error(f"An error occurred in zmq_to_cot: {e}")
+        logger.error("An error occurred in zmq_to_cot: %s", e)
     except KeyboardInterrupt:
         signal_handler(None, None)
+    finally:
+        # Flush queued CoT and join the dispatch thread however the loop ends
+        drone_manager.close()
 
 # Configuration and Execution
+# (setting, coercer, default) for every value that may come from the CLI or config.ini
+_SCHEMA = (
+    ("zmq_host", get_str, "127.0.0.1"),
+    ("zmq_port", get_int, 4224),
+    ("zmq_status_port", get_int, None),
+    ("tak_host", get_str, ""),
+    ("tak_port", get_int, None),
+    ("tak_tls_p12", get_str, ""),
+    ("tak_tls_p12_pass", get_str, ""),
+    ("tak_tls_skip_verify", get_bool, False),
+    ("tak_multicast_addr", get_str, ""),
+    ("tak_multicast_port", get_int, None),
+    ("enable_multicast", get_bool, False),
+    ("rate_limit", get_float, 1.0),
+    ("max_drones", get_int, 30),
+    ("inactivity_timeout", get_float, 60.0),
+    ("tak_multicast_interface", get_str, ""),
+)
+
+def _resolve(args: argparse.Namespace, config_values: Dict[str, Any], name: str, coercer, default: Any) -> Any:
+    """Returns a setting from the command line if given, otherwise from the config file."""
+    value = getattr(args, name)
+    if value is not None:
+        return value
+    return coercer(config_values.get(name), default)
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="ZMQ to CoT converter.")
     parser.add_argument("-c", "--config", type=str, help="Path to config file", default="config.ini")
@@ -448,10 +576,10 @@ if __name__ == "__main__":
     parser.add_argument("--tak-protocol", type=str, choices=['TCP', 'UDP'], help="TAK server communication protocol (TCP or UDP)")
     parser.add_argument("--tak-tls-p12", type=str, help="Path to TAK server TLS PKCS#12 file (optional, for TCP)")
     parser.add_argument("--tak-tls-p12-pass", type=str, help="Password for TAK server TLS PKCS#12 file (optional, for TCP)")
-    parser.add_argument("--tak-tls-skip-verify", action="store_true", help="(UNSAFE) Disable TLS server verification")
+    parser.add_argument("--tak-tls-skip-verify", action="store_true", default=None, help="(UNSAFE) Disable TLS server verification")
     parser.add_argument("--tak-multicast-addr", type=str, help="TAK multicast address (optional)")
     parser.add_argument("--tak-multicast-port", type=int, help="TAK multicast port (optional)")
-    parser.add_argument("--enable-multicast", action="store_true", help="Enable sending to multicast address")
+    parser.add_argument("--enable-multicast", action="store_true", default=None, help="Enable sending to multicast address")
     parser.add_argument("--tak-multicast-interface", type=str, help="Multicast interface (IP or name) to use for sending multicast")
     parser.add_argument("--rate-limit", type=float, help="Rate limit for sending CoT messages (seconds)")
     parser.add_argument("--max-drones", type=int, help="Maximum number of drones to track simultaneously")
@@ -467,71 +595,53 @@ if __name__ == "__main__":
     setup_logging(args.debug)
     logger.info("Starting ZMQ to CoT converter with log level: %s", "DEBUG" if args.debug else "INFO")
 
-    # Retrieve 'tak_host' and 'tak_port' with precedence
-    tak_host = args.tak_host if args.tak_host is not None else get_str(config_values.get("tak_host"))
-    tak_port = args.tak_port if args.tak_port is not None else get_int(config_values.get("tak_port"), None)
+    # Assign configuration values, giving precedence to command-line arguments
+    config = {
+        name: _resolve(args, config_values, name, coercer, default)
+        for name, coercer, default in _SCHEMA
+    }
 
-    if tak_host and tak_port:
+    if config["tak_host"] and config["tak_port"]:
         # Fetch the raw protocol value from command-line or config
         tak_protocol_raw = args.tak_protocol if args.tak_protocol is not None else config_values.get("tak_protocol")
         # Use get_str to sanitize the input, defaulting to "TCP" if necessary
         tak_protocol_sanitized = get_str(tak_protocol_raw, "TCP")
         # Convert to uppercase
-        tak_protocol = tak_protocol_sanitized.upper()
+        config["tak_protocol"] = tak_protocol_sanitized.upper()
     else:
         # If TAK host and port are not provided, set tak_protocol to None
-        tak_protocol = None
+        config["tak_protocol"] = None
         logger.info("TAK host and port not provided. 'tak_protocol' will be ignored.")
 
-    tak_multicast_interface = args.tak_multicast_interface if args.tak_multicast_interface is not None else get_str(config_values.get("tak_multicast_interface"))
-
-    # Assign configuration values, giving precedence to command-line arguments
-    config = {
-        "zmq_host": args.zmq_host if args.zmq_host is not None else get_str(config_values.get("zmq_host", "127.0.0.1")),
-        "zmq_port": args.zmq_port if args.zmq_port is not None else get_int(config_values.get("zmq_port"), 4224),
-        "zmq_status_port": args.zmq_status_port if args.zmq_status_port is not None else get_int(config_values.get("zmq_status_port"), None),
-        "tak_host": tak_host,
-        "tak_port": tak_port,
-        "tak_protocol": tak_protocol,
-        "tak_tls_p12": args.tak_tls_p12 if args.tak_tls_p12 is not None else get_str(config_values.get("tak_tls_p12")),
-        "tak_tls_p12_pass": args.tak_tls_p12_pass if args.tak_tls_p12_pass is not None else get_str(config_values.get("tak_tls_p12_pass")),
-        "tak_tls_skip_verify": args.tak_tls_skip_verify if args.tak_tls_skip_verify else get_bool(config_values.get("tak_tls_skip_verify"), False),
-        "tak_multicast_addr": args.tak_multicast_addr if args.tak_multicast_addr is not None else get_str(config_values.get("tak_multicast_addr")),
-        "tak_multicast_port": args.tak_multicast_port if args.tak_multicast_port is not None else get_int(config_values.get("tak_multicast_port"), None),
-        "enable_multicast": args.enable_multicast or get_bool(config_values.get("enable_multicast"), False),
-        "rate_limit": args.rate_limit if args.rate_limit is not None else get_float(config_values.get("rate_limit", 1.0)),
-        "max_drones": args.max_drones if args.max_drones is not None else get_int(config_values.get("max_drones", 30)),
-        "inactivity_timeout": args.inactivity_timeout if args.inactivity_timeout is not None else get_float(config_values.get("inactivity_timeout", 60.0)),
-        "tak_multicast_interface": tak_multicast_interface
-    }
-
     # Validate configuration
     try:
         validate_config(config)
     except ValueError as ve:
-        logger.critical(f"Configuration Error: {ve}")
+        logger.critical("Configuration Error: %s", ve)
         sys.exit(1)
 
+    cfg = AppConfig.from_dict(config)
+
     # Setup TLS context only if tak_protocol is set (which implies tak_host and tak_port are provided)
     tak_tls_context = setup_tls_context(
-        tak_tls_p12=config["tak_tls_p12"],
-        tak_tls_p12_pass=config["tak_tls_p12_pass"],
-        tak_tls_skip_verify=config["tak_tls_skip_verify"]
-    ) if config["tak_protocol"] == 'TCP' and config["tak_tls_p12"] else None
+        tak_tls_p12=cfg.tak_tls_p12,
+        tak_tls_p12_pass=cfg.tak_tls_p12_pass,
+        tak_tls_skip_verify=cfg.tak_tls_skip_verify
+    ) if cfg.tak_protocol == 'TCP' and cfg.tak_tls_p12 else None
 
     zmq_to_cot(
-        zmq_host=config["zmq_host"],
-        zmq_port=config["zmq_port"],
-        zmq_status_port=config["zmq_status_port"],
-        tak_host=config["tak_host"],
-        tak_port=config["tak_port"],
+        zmq_host=cfg.zmq_host,
+        zmq_port=cfg.zmq_port,
+        zmq_status_port=cfg.zmq_status_port,
+        tak_host=cfg.tak_host,
+        tak_port=cfg.tak_port,
         tak_tls_context=tak_tls_context,
-        tak_protocol=config["tak_protocol"],
-        multicast_address=config["tak_multicast_addr"],
-        multicast_port=config["tak_multicast_port"],
-        enable_multicast=config["enable_multicast"],
-        rate_limit=config["rate_limit"],
-        max_drones=config["max_drones"],
-        inactivity_timeout=config["inactivity_timeout"],
-        multicast_interface=config["tak_multicast_interface"]
+        tak_protocol=cfg.tak_protocol,
+        multicast_address=cfg.tak_multicast_addr,
+        multicast_port=cfg.tak_multicast_port,
+        enable_multicast=cfg.enable_multicast,
+        rate_limit=cfg.rate_limit,
+        max_drones=cfg.max_drones,
+        inactivity_timeout=cfg.inactivity_timeout,
+        multicast_interface=cfg.tak_multicast_interface
     )
@@ -23,93 +23,155 @@ SOFTWARE.
 """
 
 
-import datetime
-import xml.sax.saxutils
-from lxml import etree
-from typing import Optional
+import functools
+from typing import Optional, Dict, Any, Tuple
 import time
 import logging
+from utils import XML_ESCAPE_TABLE, cot_times
 
 logger = logging.getLogger(__name__)
 
+# last_sent_time for a drone that has not been sent yet; always older than any monotonic time
+NEVER_SENT = float('-inf')
+
+# Drone CoT layout as bytes, split so the body (everything after the timestamps)
+# can be reused while a drone's telemetry is unchanged. Only the uid (cached per
+# drone) and the %-fields are filled in, so the constant markup is never re-encoded.
+DRONE_COT_HEAD = (
+    b"<?xml version='1.0' encoding='UTF-8'?>\n"
+    b'<event version="2.0" uid="{uid}" type="b-m-p-s-m" time="%b" start="%b" stale="%b" how="m-g">'
+)
+DRONE_COT_BODY = (
+    b'<point lat="%.7f" lon="%.7f" hae="%.2f" ce="35.0" le="999999"/>'
+    b'<detail>'
+    b'<contact endpoint="" phone="" callsign="{uid}"/>'
+    b'<precisionlocation geopointsrc="gps" altsrc="gps"/>'
+    b'<remarks>%b</remarks>'
+    b'<color argb="-256"/>'
+    b'<usericon iconsetpath="34ae1613-9645-4222-a9d2-e5f243dea2865/Military/UAV_quad.png"/>'
+    b'</detail>'
+    b'</event>'
+)
+
+@functools.lru_cache(maxsize=256)
+def _drone_cot_template(uid: str) -> Tuple[bytes, bytes]:
+    """Returns the drone CoT head and body templates with the drone uid already filled in."""
+    uid_b = uid.translate(XML_ESCAPE_TABLE).replace('%', '%%').encode('utf-8')
+    return DRONE_COT_HEAD.replace(b'{uid}', uid_b), DRONE_COT_BODY.replace(b'{uid}', uid_b)
+
 class Drone:
     """Represents a drone and its telemetry data."""
 
+    # Fixed attribute layout: no per-instance __dict__ for every tracked drone
+    __slots__ = (
+        'id', 'mac', 'rssi', 'lat', 'lon', 'speed', 'vspeed', 'alt', 'height',
+        'pilot_lat', 'pilot_lon', 'home_lat', 'home_lon', 'description',
+        'last_update_time', 'last_sent_time', 'last_sent_state', '_cot_body'
+    )
+
     def __init__(self, id: str, lat: float, lon: float, speed: float, vspeed: float,
                  alt: float, height: float, pilot_lat: float, pilot_lon: float, description: str, mac: str, rssi: int,
                  home_lat: float = 0.0, home_lon: float = 0.0):
         self.id = id
-        self.mac = mac
-        self.rssi = rssi
-        self.lat = lat
-        self.lon = lon
-        self.speed = speed
-        self.vspeed = vspeed
-        self.alt = alt
-        self.height = height
-        self.pilot_lat = pilot_lat
-        self.pilot_lon = pilot_lon
-        self.home_lat = home_lat
-        self.home_lon = home_lon    
-        self.description = description
-        self.last_update_time = time.time()
-        self.last_sent_time = 0.0  # Track last time an update was sent
+        self.update(lat, lon, speed, vspeed, alt, height, pilot_lat, pilot_lon, description, mac, rssi,
+                    home_lat, home_lon)
+        self.last_sent_time = NEVER_SENT  # Track last time an update was sent (monotonic)
+        self.last_sent_state: Optional[tuple] = None  # cot_state() as of the last update sent
+        self._cot_body: Optional[Tuple[tuple, bytes]] = None  # (body fields, serialized CoT body) from the last build
 
     def update(self, lat: float, lon: float, speed: float, vspeed: float, alt: float,
                height: float, pilot_lat: float, pilot_lon: float, description: str, mac: str, rssi: int,
                home_lat: float = 0.0, home_lon: float = 0.0):
         """Updates the drone's telemetry data."""
-        self.lat = lat
-        self.lon = lon
-        self.speed = speed
-        self.vspeed = vspeed
-        self.alt = alt
-        self.height = height
-        self.pilot_lat = pilot_lat
-        self.pilot_lon = pilot_lon
-        self.home_lat = home_lat
-        self.home_lon = home_lon
-        self.description = description
-        self.last_update_time = time.time()
-        self.mac = mac
-        self.rssi = rssi
-
-    def to_cot_xml(self, stale_offset: Optional[float] = None) -> bytes:
-        """Converts the drone's telemetry data to a Cursor-on-Target (CoT) XML message."""
-        current_time = datetime.datetime.utcnow()
-        if stale_offset is not None:
-            stale_time = current_time + datetime.timedelta(seconds=stale_offset)
-        else:
-            stale_time = current_time + datetime.timedelta(minutes=10)
-
-        event = etree.Element(
-            'event',
-            version='2.0',
-            uid=self.id,
-            type='b-m-p-s-m',
-            time=current_time.strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
-            start=current_time.strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
-            stale=stale_time.strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
-            how='m-g'
+        self.apply({
+            'lat': lat, 'lon': lon, 'speed': speed, 'vspeed': vspeed, 'alt': alt, 'height': height,
+            'pilot_lat': pilot_lat, 'pilot_lon': pilot_lon, 'description': description,
+            'mac': mac, 'rssi': rssi, 'home_lat': home_lat, 'home_lon': home_lon
+        })
+
+    def apply(self, info: Dict[str, Any]):
+        """
+        Updates the drone from a parsed telemetry dict; missing fields fall back to defaults.
+        This is the only place telemetry fields are assigned, and it runs for every message.
+        """
+        get = info.get
+        self.lat = get('lat', 0.0)
+        self.lon = get('lon', 0.0)
+        self.speed = get('speed', 0.0)
+        self.vspeed = get('vspeed', 0.0)
+        self.alt = get('alt', 0.0)
+        self.height = get('height', 0.0)
+        self.pilot_lat = get('pilot_lat', 0.0)
+        self.pilot_lon = get('pilot_lon', 0.0)
+        self.home_lat = get('home_lat', 0.0)
+        self.home_lon = get('home_lon', 0.0)
+        self.description = get('description', "")
+        self.mac = get('mac', "")
+        self.rssi = get('rssi', 0)
+        self.last_update_time = time.monotonic()
+
+    @classmethod
+    def from_info(cls, id: str, info: Dict[str, Any]) -> "Drone":
+        """Creates a drone from a parsed telemetry dict."""
+        get = info.get
+        return cls(
+            id, lat=get('lat', 0.0), lon=get('lon', 0.0), speed=get('speed', 0.0), vspeed=get('vspeed', 0.0),
+            alt=get('alt', 0.0), height=get('height', 0.0), pilot_lat=get('pilot_lat', 0.0),
+            pilot_lon=get('pilot_lon', 0.0), description=get('description', ""), mac=get('mac', ""),
+            rssi=get('rssi', 0), home_lat=get('home_lat', 0.0), home_lon=get('home_lon', 0.0)
         )
 
-        point = etree.SubElement(
-            event,
-            'point',
-            lat=str(self.lat),
-            lon=str(self.lon),
-            hae=str(self.alt),
-            ce='35.0',
-            le='999999'
+    def to_cot_xml(self, stale_offset: Optional[float] = None, now: Optional[float] = None) -> bytes:
+        """
+        Converts the drone's telemetry data to a Cursor-on-Target (CoT) XML message.
+        `now` is an optional wall-clock time shared by all messages built in one pass.
+        """
+        timestamp, stale = cot_times(stale_offset if stale_offset is not None else 600.0, now)
+
+        head, body = _drone_cot_template(self.id)
+        # Keyed on every field that ends up in the body, at full precision
+        state = (
+            self.lat, self.lon, self.alt, self.speed, self.vspeed, self.height,
+            self.pilot_lat, self.pilot_lon, self.home_lat, self.home_lon,
+            self.description, self.mac, self.rssi
         )
+        cached = self._cot_body
+        if cached is not None and cached[0] == state:
+            body = cached[1]
+        else:
+            body = body % (
+                self.lat,
+                self.lon,
+                self.alt,
+                self._remarks().translate(XML_ESCAPE_TABLE).encode('utf-8')
+            )
+            self._cot_body = (state, body)
+        timestamp_b = timestamp.encode('ascii')
+        cot_xml = head % (timestamp_b, timestamp_b, stale.encode('ascii')) + body
+
+        # Debug log: only decode the message when DEBUG is actually enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("CoT XML for drone '%s':\n%s", self.id, cot_xml.decode('utf-8'))
 
-        detail = etree.SubElement(event, 'detail')
-
-        etree.SubElement(detail, 'contact', endpoint='', phone='', callsign=self.id)
+        return cot_xml
 
-        etree.SubElement(detail, 'precisionlocation', geopointsrc='gps', altsrc='gps')
+    def cot_state(self) -> tuple:
+        """
+        Returns the telemetry that decides whether a resend is worthwhile, for change detection.
+        Positions are rounded to about 0.1 m so GPS jitter doesn't count as a change, and RSSI,
+        which varies on nearly every frame, is left out.
+        """
+        return (
+            self.id, self.mac, self.description,
+            round(self.lat, 6), round(self.lon, 6), round(self.alt, 1), round(self.height, 1),
+            round(self.speed, 1), round(self.vspeed, 1),
+            round(self.pilot_lat, 6), round(self.pilot_lon, 6),
+            round(self.home_lat, 6), round(self.home_lon, 6)
+        )
 
-        remarks_text = (
+    def _remarks(self) -> str:
+        """Builds the unescaped CoT remarks text."""
+        return (
             f"MAC: {self.mac}, RSSI: {self.rssi}dBm, "
             f"Self-ID: {self.description}, "
             f"Location/Vector: [Speed: {self.speed} m/s, Vert Speed: {self.vspeed} m/s, "
@@ -117,21 +179,3 @@ class Drone:
             f"System: [Operator Lat: {self.pilot_lat}, Operator Lon: {self.pilot_lon}, "
             f"Home Lat: {self.home_lat}, Home Lon: {self.home_lon}]"
         )
-        remarks_text = xml.sax.saxutils.escape(remarks_text)
-        etree.SubElement(detail, 'remarks').text = remarks_text
-
-        etree.SubElement(detail, 'color', argb='-256')
-
-        etree.SubElement(
-            detail,
-            'usericon',
-            iconsetpath='34ae1613-9645-4222-a9d2-e5f243dea2865/Military/UAV_quad.png'
-        )
-
-        # Convert Element to XML bytes
-        cot_xml = etree.tostring(event, pretty_print=True, xml_declaration=True, encoding='UTF-8')
-
-        # Debug log: only prints if logging level is DEBUG
-        logger.debug("CoT XML for drone '%s':\n%s", self.id, cot_xml.decode('utf-8'))
-
-        return cot_xml
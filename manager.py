@@ -22,12 +22,14 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import heapq
+import threading
 import time
-from collections import deque
-from typing import Optional
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
 import logging
 
-from drone import Drone
+from drone import Drone, NEVER_SENT
 from messaging import CotMessenger
 
 logger = logging.getLogger(__name__)
@@ -35,7 +37,7 @@ logger = logging.getLogger(__name__)
 class DroneManager:
     """Manages a collection of drones and handles their updates."""
 
-    def __init__(self, max_drones=30, rate_limit=1.0, inactivity_timeout=60.0,
+    def __init__(self, max_drones: int = 30, rate_limit: float = 1.0, inactivity_timeout: float = 60.0,
                  cot_messenger: Optional[CotMessenger] = None):
         """
         Initializes the DroneManager.
@@ -45,71 +47,164 @@ class DroneManager:
         :param inactivity_timeout: Time after which a drone is considered inactive (in seconds).
         :param cot_messenger: Instance of CotMessenger for sending CoT messages.
         """
-        self.drones = deque(maxlen=max_drones)
-        self.drone_dict = {}
-        self.rate_limit = rate_limit  # Active drone update frequency
-        self.inactivity_timeout = inactivity_timeout  # Time before a drone is considered stale
-        self.keep_alive_interval = 10.0  # Interval for sending keep-alive CoT updates for inactive drones
-        self.cot_messenger = cot_messenger
-
-    def update_or_add_drone(self, drone_id: str, drone_data: Drone):
+        self.drones: "OrderedDict[str, Drone]" = OrderedDict()  # drone_id -> Drone, oldest first
+        self.max_drones: int = max_drones
+        self.rate_limit: float = rate_limit  # Active drone update frequency
+        self.inactivity_timeout: float = inactivity_timeout  # Time before a drone is considered stale
+        self.keep_alive_interval: float = 10.0  # Interval for sending keep-alive CoT updates for inactive drones
+        # A drone re-reporting identical telemetry is resent this often instead of every rate_limit
+        self.unchanged_resend_interval: float = min(max(rate_limit * 5, 5.0), inactivity_timeout / 2)
+        self.cot_messenger: Optional[CotMessenger] = cot_messenger
+        # (last_update_time when pushed, drone_id), oldest first; see send_updates. Each
+        # tracked drone has exactly one live entry, whose time is kept in _expiry_times.
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._expiry_times: Dict[str, float] = {}  # drone_id -> time of its live heap entry
+
+        # CoT is handed to a background thread so a slow or reconnecting TAK server
+        # never stalls the ZMQ receive loop. Unsent messages are held per uid and a
+        # newer one replaces the older, so a stalled link never builds a backlog and
+        # only the latest state is flushed once it recovers.
+        self._pending: "OrderedDict[str, bytes]" = OrderedDict()  # uid -> CoT XML
+        self._pending_ready = threading.Condition()
+        self._closing: bool = False
+        self._dispatch_thread: Optional[threading.Thread] = None
+        if cot_messenger:
+            self._dispatch_thread = threading.Thread(
+                target=self._dispatch_loop, name="cot-dispatch", daemon=True
+            )
+            self._dispatch_thread.start()
+
+    def update_or_add_drone(self, drone_id: str, drone_data: Drone) -> None:
         """Updates an existing drone or adds a new one to the collection."""
-        if drone_id not in self.drone_dict:
-            if len(self.drones) >= self.drones.maxlen:
-                oldest_drone_id = self.drones.popleft()
-                del self.drone_dict[oldest_drone_id]
-                logger.debug(f"Removed oldest drone: {oldest_drone_id}")
-            self.drones.append(drone_id)
-            self.drone_dict[drone_id] = drone_data
-            drone_data.last_sent_time = 0.0  # Initialize last sent time for the new drone
-            logger.debug(f"Added new drone: {drone_id}")
+        existing = self.drones.get(drone_id)
+        if existing is None:
+            if len(self.drones) >= self.max_drones:
+                oldest_drone_id, _ = self.drones.popitem(last=False)
+                # Drop its heap entry now: evictions can happen at message rate, so waiting
+                # for the entry to age out would let the heap grow without bound
+                self._expiry_heap.remove((self._expiry_times.pop(oldest_drone_id), oldest_drone_id))
+                heapq.heapify(self._expiry_heap)
+                logger.debug("Removed oldest drone: %s", oldest_drone_id)
+            self.drones[drone_id] = drone_data
+            self._expiry_times[drone_id] = drone_data.last_update_time
+            heapq.heappush(self._expiry_heap, (drone_data.last_update_time, drone_id))
+            drone_data.last_sent_time = NEVER_SENT  # Initialize last sent time for the new drone
+            logger.debug("Added new drone: %s", drone_id)
         else:
-            self.drone_dict[drone_id].update(
+            existing.update(
                 lat=drone_data.lat, lon=drone_data.lon, speed=drone_data.speed,
                 vspeed=drone_data.vspeed, alt=drone_data.alt, height=drone_data.height,
                 pilot_lat=drone_data.pilot_lat, pilot_lon=drone_data.pilot_lon,
                 description=drone_data.description, mac=drone_data.mac, rssi=drone_data.rssi
             )
-            logger.debug(f"Updated drone: {drone_id}")
+            logger.debug("Updated drone: %s", drone_id)
 
-    def send_updates(self):
+    def send_updates(self) -> None:
         """Sends updates to the TAK server or multicast address."""
-        current_time = time.time()
-        drones_to_remove = []
+        # Ages and send intervals use the monotonic clock so wall-clock steps (NTP, GPS
+        # time sync) can't stall or burst updates; CoT timestamps share one wall-clock read
+        current_time = time.monotonic()
+        wall_time = time.time()
+        cot_batch: List[Tuple[str, bytes]] = []  # (uid, CoT XML), queued together after the loop
 
-        for drone_id in list(self.drones):
-            drone = self.drone_dict[drone_id]
-            time_since_update = current_time - drone.last_update_time
+        # Bind settings and methods once rather than on every drone
+        rate_limit = self.rate_limit
+        inactivity_timeout = self.inactivity_timeout
+        keep_alive_interval = self.keep_alive_interval
+        unchanged_resend_interval = self.unchanged_resend_interval
+        queue_cot = cot_batch.append
 
-            # Remove drones that have been inactive beyond the timeout
-            if time_since_update > self.inactivity_timeout:
-                # Final stale CoT message
-                cot_xml = drone.to_cot_xml(stale_offset=0)  # Set stale time to current time
-                if self.cot_messenger:
-                    self.cot_messenger.send_cot(cot_xml)
-                drones_to_remove.append(drone_id)
-                logger.debug(f"Drone {drone_id} inactive for {time_since_update:.2f}s. Sent final CoT message.")
+        # Remove drones that have been inactive beyond the timeout. Heap entries carry the
+        # update time a drone had when it was pushed; drones updated since then are
+        # re-pushed with their current time instead of being checked on every tick.
+        expiry_heap = self._expiry_heap
+        expiry_times = self._expiry_times
+        expiry_cutoff = current_time - inactivity_timeout
+        while expiry_heap and expiry_heap[0][0] < expiry_cutoff:
+            pushed_time, drone_id = heapq.heappop(expiry_heap)
+            if expiry_times.get(drone_id) != pushed_time:
+                continue  # Not the drone's live entry
+            drone = self.drones[drone_id]
+            if drone.last_update_time > pushed_time:
+                expiry_times[drone_id] = drone.last_update_time
+                heapq.heappush(expiry_heap, (drone.last_update_time, drone_id))
                 continue
+            # Final stale CoT message
+            queue_cot((drone_id, drone.to_cot_xml(stale_offset=0, now=wall_time)))  # Set stale time to current time
+            del self.drones[drone_id]
+            del expiry_times[drone_id]
+            logger.debug(
+                "Drone %s inactive for %.2fs. Queued final CoT message and removed it.",
+                drone_id, current_time - drone.last_update_time
+            )
+
+        for drone_id, drone in self.drones.items():
+            time_since_update = current_time - drone.last_update_time
+            time_since_sent = current_time - drone.last_sent_time
 
             # Active drone: send updates based on the rate limit
-            if time_since_update < self.rate_limit:
-                if current_time - drone.last_sent_time >= self.rate_limit:
-                    cot_xml = drone.to_cot_xml(stale_offset=self.inactivity_timeout - time_since_update)
-                    if self.cot_messenger:
-                        self.cot_messenger.send_cot(cot_xml)
-                        drone.last_sent_time = current_time
-                        logger.debug(f"Sent CoT update for active drone {drone_id} after {time_since_update:.2f}s.")
+            if time_since_update < rate_limit:
+                if time_since_sent >= rate_limit:
+                    state = drone.cot_state()
+                    if state == drone.last_sent_state and time_since_sent < unchanged_resend_interval:
+                        continue
+                    queue_cot((drone_id, drone.to_cot_xml(stale_offset=inactivity_timeout - time_since_update, now=wall_time)))
+                    drone.last_sent_time = current_time
+                    drone.last_sent_state = state
+                    logger.debug("Queued CoT update for active drone %s after %.2fs.", drone_id, time_since_update)
             else:
                 # Inactive-but-not-stale drone: send less frequent keep-alive updates
-                if current_time - drone.last_sent_time >= self.keep_alive_interval:
-                    cot_xml = drone.to_cot_xml(stale_offset=self.inactivity_timeout - time_since_update)
-                    if self.cot_messenger:
-                        self.cot_messenger.send_cot(cot_xml)
-                        drone.last_sent_time = current_time
-                        logger.debug(f"Sent keep-alive CoT update for inactive drone {drone_id}.")
-
-        # Remove inactive drones after sending the final stale message
-        for drone_id in drones_to_remove:
-            self.drones.remove(drone_id)
-            del self.drone_dict[drone_id]
-            logger.debug(f"Removed drone: {drone_id}")
+                if time_since_sent >= keep_alive_interval:
+                    queue_cot((drone_id, drone.to_cot_xml(stale_offset=inactivity_timeout - time_since_update, now=wall_time)))
+                    drone.last_sent_time = current_time
+                    logger.debug("Queued keep-alive CoT update for inactive drone %s.", drone_id)
+
+        if cot_batch:
+            self._enqueue(cot_batch)
+
+    def enqueue_cot(self, uid: str, cot_xml: bytes) -> None:
+        """
+        Queues a CoT message for the dispatch thread.
+
+        :param uid: CoT uid of the message; replaces any unsent message with the same uid.
+        :param cot_xml: The CoT XML message in bytes.
+        """
+        self._enqueue(((uid, cot_xml),))
+
+    def _enqueue(self, cot_batch: Iterable[Tuple[str, bytes]]) -> None:
+        """Adds (uid, CoT XML) pairs to the pending messages and wakes the dispatch thread."""
+        if not self._dispatch_thread:
+            return
+        with self._pending_ready:
+            pending = self._pending
+            for uid, cot_xml in cot_batch:
+                if uid in pending:
+                    logger.debug("Replacing unsent CoT message for %s.", uid)
+                pending[uid] = cot_xml
+            self._pending_ready.notify()
+
+    def _dispatch_loop(self) -> None:
+        """Sends pending CoT messages until close() is called and nothing is left."""
+        messenger = self.cot_messenger
+        assert messenger is not None  # The thread is only started with a messenger
+        while True:
+            with self._pending_ready:
+                while not self._pending and not self._closing:
+                    self._pending_ready.wait()
+                if not self._pending:
+                    return
+                cot_batch = list(self._pending.values())
+                self._pending.clear()
+            try:
+                messenger.send_cot_batch(cot_batch)
+            except Exception as e:
+                logger.error("Error sending CoT batch: %s", e)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flushes pending CoT messages and stops the dispatch thread."""
+        if self._dispatch_thread:
+            with self._pending_ready:
+                self._closing = True
+                self._pending_ready.notify()
+            self._dispatch_thread.join(timeout)
+            self._dispatch_thread = None
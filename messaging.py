@@ -25,10 +25,11 @@ SOFTWARE.
 import socket
 import struct
 import logging
+import threading
 import time
-from typing import Optional
+from typing import Iterable, Optional
 from tak_client import TAKClient
-from tak_udp_client import TAKUDPClient
+from tak_udp_client import TAKUDPClient, SEND_BUFFER_SIZE, SEND_FLAGS
 
 logger = logging.getLogger(__name__)
 
@@ -65,7 +66,7 @@ def resolve_interface_to_ip(interface: str) -> Optional[str]:
                     ip_addr = addr_info.get("addr")
                     if ip_addr:
                         return ip_addr
-        logger.error(f"Interface '{interface}' not found or has no IPv4 address.")
+        logger.error("Interface '%s' not found or has no IPv4 address.", interface)
     else:
         logger.error(
             "Cannot resolve interface name to IP without `netifaces`. "
@@ -104,12 +105,18 @@ class CotMessenger:
         self.enable_multicast = enable_multicast
         self.multicast_interface = multicast_interface
         self.multicast_socket = None
+        # DroneManager sends from its dispatch thread while callers may still use
+        # send_cot directly; the transports are not thread-safe
+        self._send_lock = threading.Lock()
 
         if self.enable_multicast and self.multicast_address and self.multicast_port:
             try:
                 self.multicast_socket = socket.socket(
                     socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP
                 )
+                self.multicast_socket.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER_SIZE
+                )
                 ttl = struct.pack("b", 1)
                 self.multicast_socket.setsockopt(
                     socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, ttl
@@ -124,21 +131,21 @@ class CotMessenger:
                                 socket.IPPROTO_IP, socket.IP_MULTICAST_IF, packed_if
                             )
                             logger.debug(
-                                f"Set multicast interface to {interface_ip}"
+                                "Set multicast interface to %s", interface_ip
                             )
                         except Exception as e:
                             logger.error(
-                                f"Failed to set multicast interface '{self.multicast_interface}': {e}"
+                                "Failed to set multicast interface '%s': %s", self.multicast_interface, e
                             )
                     else:
                         logger.error(
-                            f"Could not resolve '{self.multicast_interface}' to a valid IP."
+                            "Could not resolve '%s' to a valid IP.", self.multicast_interface
                         )
                 logger.debug(
-                    f"Initialized persistent multicast socket for {self.multicast_address}:{self.multicast_port}"
+                    "Initialized persistent multicast socket for %s:%s", self.multicast_address, self.multicast_port
                 )
             except Exception as e:
-                logger.error(f"Failed to initialize multicast socket: {e}")
+                logger.error("Failed to initialize multicast socket: %s", e)
         else:
             if self.enable_multicast:
                 logger.error(
@@ -161,79 +168,124 @@ class CotMessenger:
         """
         logger.debug("send_cot method called.")
         logger.debug(
-            f"Multicast Enabled: {self.enable_multicast}, Multicast Socket: {'Initialized' if self.multicast_socket else 'Not Initialized'}"
+            "Multicast Enabled: %s, Multicast Socket: %s", self.enable_multicast, 'Initialized' if self.multicast_socket else 'Not Initialized'
         )
 
-        # Sending to TAK server via TCP/TLS
-        if self.tak_client:
-            for attempt in range(1, retry_count + 1):
-                try:
-                    self.tak_client.send(cot_xml)
-                    logger.info(
-                        f"Sent CoT message to TAK server via TCP/TLS at {self.tak_client.host}:{self.tak_client.port}"
-                    )
-                    break
-                except Exception as e:
-                    logger.error(
-                        f"Attempt {attempt}: Failed to send CoT message via TCP/TLS: {e}"
-                    )
-                    if attempt < retry_count:
-                        time.sleep(retry_delay)
-                    else:
-                        logger.critical(
-                            "Exceeded maximum retries for sending CoT message via TCP/TLS."
-                        )
-        elif self.tak_udp_client:
-            for attempt in range(1, retry_count + 1):
-                try:
-                    self.tak_udp_client.send(cot_xml)
-                    logger.info(
-                        f"Sent CoT message to TAK server via UDP at {self.tak_udp_client.host}:{self.tak_udp_client.port}"
-                    )
-                    break
-                except Exception as e:
-                    logger.error(
-                        f"Attempt {attempt}: Failed to send CoT message via UDP: {e}"
-                    )
-                    if attempt < retry_count:
-                        time.sleep(retry_delay)
-                    else:
-                        logger.critical(
-                            "Exceeded maximum retries for sending CoT message via UDP."
-                        )
-        else:
-            logger.debug(
-                "No TAK client configured. Skipping sending CoT message to TAK server."
-            )
-
-        # Sending to multicast address
-        if self.enable_multicast and self.multicast_socket:
-            logger.debug(
-                f"Attempting to send CoT message via multicast to {self.multicast_address}:{self.multicast_port}"
-            )
-            for attempt in range(1, retry_count + 1):
-                try:
-                    self.multicast_socket.sendto(
-                        cot_xml, (self.multicast_address, self.multicast_port)
+        with self._send_lock:
+            # Sending to TAK server via TCP/TLS
+            if self.tak_client:
+                self._send_tcp(cot_xml, retry_count, retry_delay)
+            elif self.tak_udp_client:
+                self._send_udp(cot_xml, retry_count, retry_delay)
+            else:
+                logger.debug(
+                    "No TAK client configured. Skipping sending CoT message to TAK server."
+                )
+
+            # Sending to multicast address
+            if self.enable_multicast and self.multicast_socket:
+                logger.debug(
+                    "Attempting to send CoT message via multicast to %s:%s", self.multicast_address, self.multicast_port
+                )
+                self._send_multicast(cot_xml, retry_count, retry_delay)
+            else:
+                logger.debug(
+                    "Multicast is not enabled or multicast socket not initialized. Skipping sending CoT message to multicast."
+                )
+
+    def send_cot_batch(
+        self, cot_xmls: Iterable[bytes], retry_count: int = 3, retry_delay: float = 1.0
+    ):
+        """
+        Sends several CoT messages in one pass.
+
+        The TCP/TLS stream receives them as a single write; UDP and multicast
+        still need one datagram per message.
+
+        :param cot_xmls: The CoT XML messages in bytes.
+        :param retry_count: Number of retry attempts for sending.
+        :param retry_delay: Delay between retries in seconds.
+        """
+        cot_xmls = list(cot_xmls)
+        if not cot_xmls:
+            return
+
+        with self._send_lock:
+            if self.tak_client:
+                self._send_tcp(b"".join(cot_xmls), retry_count, retry_delay)
+            elif self.tak_udp_client:
+                for cot_xml in cot_xmls:
+                    self._send_udp(cot_xml, retry_count, retry_delay)
+
+            if self.enable_multicast and self.multicast_socket:
+                for cot_xml in cot_xmls:
+                    self._send_multicast(cot_xml, retry_count, retry_delay)
+
+    def _send_tcp(self, payload: bytes, retry_count: int, retry_delay: float):
+        """Sends a payload to the TAK server via TCP/TLS with retries."""
+        for attempt in range(1, retry_count + 1):
+            try:
+                self.tak_client.send(payload)
+                logger.info(
+                    "Sent CoT message to TAK server via TCP/TLS at %s:%s", self.tak_client.host, self.tak_client.port
+                )
+                break
+            except Exception as e:
+                logger.error(
+                    "Attempt %s: Failed to send CoT message via TCP/TLS: %s", attempt, e
+                )
+                if attempt < retry_count:
+                    time.sleep(retry_delay)
+                else:
+                    logger.critical(
+                        "Exceeded maximum retries for sending CoT message via TCP/TLS."
                     )
-                    logger.info(
-                        f"Sent CoT message to multicast address {self.multicast_address}:{self.multicast_port} using interface '{self.multicast_interface}'."
+
+    def _send_udp(self, payload: bytes, retry_count: int, retry_delay: float):
+        """Sends a payload to the TAK server via UDP with retries."""
+        for attempt in range(1, retry_count + 1):
+            try:
+                self.tak_udp_client.send(payload)
+                logger.info(
+                    "Sent CoT message to TAK server via UDP at %s:%s", self.tak_udp_client.host, self.tak_udp_client.port
+                )
+                break
+            except Exception as e:
+                logger.error(
+                    "Attempt %s: Failed to send CoT message via UDP: %s", attempt, e
+                )
+                if attempt < retry_count:
+                    time.sleep(retry_delay)
+                else:
+                    logger.critical(
+                        "Exceeded maximum retries for sending CoT message via UDP."
                     )
-                    break
-                except Exception as e:
-                    logger.error(
-                        f"Attempt {attempt}: Failed to send CoT message via multicast: {e}"
+
+    def _send_multicast(self, payload: bytes, retry_count: int, retry_delay: float):
+        """Sends a payload to the multicast group with retries."""
+        for attempt in range(1, retry_count + 1):
+            try:
+                self.multicast_socket.sendto(
+                    payload, SEND_FLAGS, (self.multicast_address, self.multicast_port)
+                )
+                logger.info(
+                    "Sent CoT message to multicast address %s:%s using interface '%s'.", self.multicast_address, self.multicast_port, self.multicast_interface
+                )
+                break
+            except BlockingIOError:
+                # Retrying straight away would only block the loop; newer CoT follows soon
+                logger.warning("Multicast send buffer full. Dropping CoT message.")
+                break
+            except Exception as e:
+                logger.error(
+                    "Attempt %s: Failed to send CoT message via multicast: %s", attempt, e
+                )
+                if attempt < retry_count:
+                    time.sleep(retry_delay)
+                else:
+                    logger.critical(
+                        "Exceeded maximum retries for sending CoT message via multicast."
                     )
-                    if attempt < retry_count:
-                        time.sleep(retry_delay)
-                    else:
-                        logger.critical(
-                            "Exceeded maximum retries for sending CoT message via multicast."
-                        )
-        else:
-            logger.debug(
-                "Multicast is not enabled or multicast socket not initialized. Skipping sending CoT message to multicast."
-            )
 
     def close(self):
         """Closes persistent multicast sockets and TAK clients if initialized."""
@@ -242,7 +294,7 @@ class CotMessenger:
                 self.multicast_socket.close()
                 logger.debug("Closed multicast socket.")
             except Exception as e:
-                logger.error(f"Error closing multicast socket: {e}")
+                logger.error("Error closing multicast socket: %s", e)
 
         # Close TAK clients if they exist
         if self.tak_client:
@@ -250,11 +302,11 @@ class CotMessenger:
                 self.tak_client.close()
                 logger.debug("Closed TAK TCP/TLS client.")
             except Exception as e:
-                logger.error(f"Error closing TAK TCP/TLS client: {e}")
+                logger.error("Error closing TAK TCP/TLS client: %s", e)
 
         if self.tak_udp_client:
             try:
                 self.tak_udp_client.close()
                 logger.debug("Closed TAK UDP client.")
             except Exception as e:
-                logger.error(f"Error closing TAK UDP client: {e}")
+                logger.error("Error closing TAK UDP client: %s", e)
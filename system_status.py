@@ -23,15 +23,41 @@ SOFTWARE.
 """
 
 
-import datetime
-import xml.sax.saxutils
-from lxml import etree
+import functools
 from typing import Optional
 import time
 import logging
+from utils import XML_ESCAPE_TABLE, cot_times
 
 logger = logging.getLogger(__name__)
 
+# Status CoT layout as bytes; only the uid (cached per kit) and the %-fields are
+# filled in per message
+STATUS_COT_TEMPLATE = (
+    b"<?xml version='1.0' encoding='UTF-8'?>\n"
+    b'<event version="2.0" uid="{uid}" type="b-m-p-s-m" time="%b" start="%b" stale="%b" how="m-g">'
+    b'<point lat="%.7f" lon="%.7f" hae="%.2f" ce="35.0" le="999999"/>'
+    b'<detail>'
+    b'<contact endpoint="" phone="" callsign="{uid}"/>'
+    b'<precisionlocation geopointsrc="gps" altsrc="gps"/>'
+    b'<remarks>%b</remarks>'
+    b'<color argb="-256"/>'
+    b'<usericon iconsetpath="34ae1613-9645-4222-a9d2-e5f243dea2865/Military/Ground_Vehicle.png"/>'
+    b'</detail>'
+    b'</event>'
+)
+
+@functools.lru_cache(maxsize=64)
+def _status_cot_template(uid: str) -> bytes:
+    """Returns the status CoT template with the kit uid already filled in."""
+    uid_b = uid.translate(XML_ESCAPE_TABLE).replace('%', '%%').encode('utf-8')
+    return STATUS_COT_TEMPLATE.replace(b'{uid}', uid_b)
+
+@functools.lru_cache(maxsize=8)
+def _kit_id(serial_number: str) -> str:
+    """Returns the CoT uid for a kit; the serial rarely changes between messages."""
+    return f"wardragon-{serial_number}"
+
 class SystemStatus:
     """Represents system status data."""
 
@@ -48,10 +74,10 @@ class SystemStatus:
         disk_used: float = 0.0,
         temperature: float = 0.0,
         uptime: float = 0.0,
-        pluto_temp: str = 'N/A',
-        zynq_temp: str = 'N/A' 
+        pluto_temp: Optional[float] = None,
+        zynq_temp: Optional[float] = None
     ):
-        self.id = f"wardragon-{serial_number}"
+        self.id = _kit_id(serial_number)
         self.lat = lat
         self.lon = lon
         self.alt = alt
@@ -68,35 +94,7 @@ class SystemStatus:
         
     def to_cot_xml(self) -> bytes:
         """Converts the system status data to a CoT XML message."""
-        current_time = datetime.datetime.utcnow()
-        stale_time = current_time + datetime.timedelta(minutes=10)
-
-        event = etree.Element(
-            'event',
-            version='2.0',
-            uid=self.id,
-            type='b-m-p-s-m',
-            time=current_time.strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
-            start=current_time.strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
-            stale=stale_time.strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
-            how='m-g'
-        )
-
-        point = etree.SubElement(
-            event,
-            'point',
-            lat=str(self.lat),
-            lon=str(self.lon),
-            hae=str(self.alt),
-            ce='35.0',
-            le='999999'
-        )
-
-        detail = etree.SubElement(event, 'detail')
-
-        etree.SubElement(detail, 'contact', endpoint='', phone='', callsign=self.id)
-
-        etree.SubElement(detail, 'precisionlocation', geopointsrc='gps', altsrc='gps')
+        timestamp, stale = cot_times(600.0)
 
         # Format remarks with system statistics
         remarks_text = (
@@ -105,28 +103,24 @@ class SystemStatus:
             f"Disk Total: {self.disk_total:.2f} MB, Disk Used: {self.disk_used:.2f} MB, "
             f"Temperature: {self.temperature}°C, "
             f"Uptime: {self.uptime} seconds, "
-            f"Pluto Temp: {self.pluto_temp}°C, "
-            f"Zynq Temp: {self.zynq_temp}°C"
+            f"Pluto Temp: {'N/A' if self.pluto_temp is None else self.pluto_temp}°C, "
+            f"Zynq Temp: {'N/A' if self.zynq_temp is None else self.zynq_temp}°C"
         )
 
-        # Escape special characters in remarks
-        remarks_text = xml.sax.saxutils.escape(remarks_text)
-
-        etree.SubElement(detail, 'remarks').text = remarks_text
-
-        etree.SubElement(detail, 'color', argb='-256')
-
-        # Include usericon
-        etree.SubElement(
-            detail,
-            'usericon',
-            iconsetpath='34ae1613-9645-4222-a9d2-e5f243dea2865/Military/Ground_Vehicle.png'  # Use appropriate icon
+        timestamp_b = timestamp.encode('ascii')
+        cot_xml_bytes = _status_cot_template(self.id) % (
+            timestamp_b,
+            timestamp_b,
+            stale.encode('ascii'),
+            self.lat,
+            self.lon,
+            self.alt,
+            remarks_text.translate(XML_ESCAPE_TABLE).encode('utf-8')
         )
 
-        cot_xml_bytes = etree.tostring(event, pretty_print=True, xml_declaration=True, encoding='UTF-8')
-
         # --- Debug Logging ---
-        # Only prints if the logger is set to DEBUG (e.g. by --debug in your main script)
-        logger.debug("SystemStatus CoT XML for '%s':\n%s", self.id, cot_xml_bytes.decode('utf-8'))
+        # Only decodes and prints if the logger is set to DEBUG (e.g. by --debug in your main script)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("SystemStatus CoT XML for '%s':\n%s", self.id, cot_xml_bytes.decode('utf-8'))
 
         return cot_xml_bytes
@@ -66,7 +66,7 @@ class TAKClient:
                 return
             except Exception as e:
                 wait_time = self.backoff_factor ** self.retry_count
-                logger.error(f"Error connecting to TAK server: {e}. Retrying in {wait_time} seconds...")
+                logger.error("Error connecting to TAK server: %s. Retrying in %s seconds...", e, wait_time)
                 time.sleep(wait_time)
                 self.retry_count += 1
 
@@ -80,11 +80,11 @@ class TAKClient:
                 self.connect()
             if self.sock:
                 self.sock.sendall(cot_xml)
-                logger.debug(f"Sent CoT message via TCP/TLS: {cot_xml}")
+                logger.debug("Sent CoT message via TCP/TLS: %s", cot_xml)
             else:
                 logger.error("No socket available to send CoT message via TCP/TLS.")
         except Exception as e:
-            logger.error(f"Error sending CoT message via TCP/TLS: {e}")
+            logger.error("Error sending CoT message via TCP/TLS: %s", e)
             self.close()
             self.connect()
 
@@ -95,6 +95,6 @@ class TAKClient:
                 self.sock.close()
                 logger.debug("Closed TAKClient TCP/TLS socket")
             except Exception as e:
-                logger.error(f"Error closing TAKClient TCP/TLS socket: {e}")
+                logger.error("Error closing TAKClient TCP/TLS socket: %s", e)
             finally:
                 self.sock = None
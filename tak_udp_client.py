@@ -28,6 +28,11 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Room for a burst of CoT datagrams so a busy NIC queue does not stall the main loop
+SEND_BUFFER_SIZE = 1 << 20
+# Datagram sends never block; if the buffer is still full the message is dropped
+SEND_FLAGS = getattr(socket, "MSG_DONTWAIT", 0)
+
 class TAKUDPClient:
     """Client for sending CoT messages to TAK server via UDP."""
 
@@ -35,7 +40,8 @@ class TAKUDPClient:
         self.tak_host = tak_host
         self.tak_port = tak_port
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        logger.debug(f"Initialized TAKUDPClient for {self.tak_host}:{self.tak_port}")
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER_SIZE)
+        logger.debug("Initialized TAKUDPClient for %s:%s", self.tak_host, self.tak_port)
 
     # Added Properties
     @property
@@ -51,10 +57,12 @@ class TAKUDPClient:
     def send(self, cot_xml: bytes):
         """Sends a CoT XML message to the TAK server via UDP."""
         try:
-            self.sock.sendto(cot_xml, (self.tak_host, self.tak_port))
-            logger.debug(f"Sent CoT message via UDP to {self.tak_host}:{self.tak_port}")
+            self.sock.sendto(cot_xml, SEND_FLAGS, (self.tak_host, self.tak_port))
+            logger.debug("Sent CoT message via UDP to %s:%s", self.tak_host, self.tak_port)
+        except BlockingIOError:
+            logger.warning("UDP send buffer full. Dropping CoT message.")
         except Exception as e:
-            logger.error(f"Error sending CoT message via UDP: {e}")
+            logger.error("Error sending CoT message via UDP: %s", e)
 
     def close(self):
         """Closes the UDP socket."""
@@ -62,4 +70,4 @@ class TAKUDPClient:
             self.sock.close()
             logger.debug("Closed TAKUDPClient socket")
         except Exception as e:
-            logger.error(f"Error closing TAKUDPClient socket: {e}")
+            logger.error("Error closing TAKUDPClient socket: %s", e)
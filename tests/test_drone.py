@@ -0,0 +1,83 @@
+import inspect
+import xml.etree.ElementTree as ET
+
+from drone import Drone
+
+
+def make_drone(**overrides):
+    info = {
+        'lat': 35.1234567, 'lon': -80.7654321, 'alt': 120.5, 'speed': 3.0, 'vspeed': -0.5,
+        'height': 40.0, 'pilot_lat': 35.1, 'pilot_lon': -80.7, 'description': 'Test drone',
+        'mac': 'aa:bb:cc:dd:ee:ff', 'rssi': -60,
+    }
+    info.update(overrides)
+    return Drone.from_info('drone-TEST123', info)
+
+
+def test_cot_xml_is_well_formed():
+    drone = make_drone(description='Self <id> & "quoted" 100%')
+    event = ET.fromstring(drone.to_cot_xml(stale_offset=30.0, now=1700000000.25))
+
+    assert event.tag == 'event'
+    assert event.get('uid') == 'drone-TEST123'
+    assert event.get('type') == 'b-m-p-s-m'
+    assert event.get('time') == event.get('start') == '2023-11-14T22:13:20.250000Z'
+    assert event.get('stale') == '2023-11-14T22:13:50.250000Z'
+
+    point = event.find('point')
+    assert float(point.get('lat')) == 35.1234567
+    assert float(point.get('lon')) == -80.7654321
+    assert float(point.get('hae')) == 120.5
+
+    detail = event.find('detail')
+    assert detail.find('contact').get('callsign') == 'drone-TEST123'
+    remarks = detail.find('remarks').text
+    assert 'Self-ID: Self <id> & "quoted" 100%' in remarks
+    assert 'RSSI: -60dBm' in remarks
+
+
+def test_cot_xml_escapes_uid():
+    drone = Drone.from_info('drone-<a&b>%s', {'lat': 1.0, 'lon': 2.0})
+    event = ET.fromstring(drone.to_cot_xml())
+
+    assert event.get('uid') == 'drone-<a&b>%s'
+    assert event.find('detail/contact').get('callsign') == 'drone-<a&b>%s'
+
+
+def test_cot_xml_reflects_updates():
+    drone = make_drone()
+    drone.to_cot_xml()
+    drone.apply({'lat': 36.0, 'lon': -81.0, 'rssi': -70})
+    event = ET.fromstring(drone.to_cot_xml())
+
+    assert float(event.find('point').get('lat')) == 36.0
+    assert 'RSSI: -70dBm' in event.find('detail/remarks').text
+
+
+def test_from_info_matches_constructor():
+    drone = Drone.from_info('drone-X', {'lat': 1.5, 'lon': 2.5, 'mac': 'aa', 'rssi': -40})
+    expected = Drone('drone-X', 1.5, 2.5, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, "", 'aa', -40)
+
+    for name in Drone.__slots__:
+        if name != 'last_update_time':
+            assert getattr(drone, name) == getattr(expected, name), name
+
+
+def test_telemetry_fields_follow_update_signature():
+    # update(), apply() and from_info() each name the telemetry fields; a field added
+    # to or renamed in update() must be picked up by all of them
+    fields = [name for name in inspect.signature(Drone.update).parameters if name != 'self']
+    bookkeeping = {'id', 'last_update_time', 'last_sent_time', 'last_sent_state', '_cot_body'}
+    assert set(fields) == set(Drone.__slots__) - bookkeeping
+
+    values = {name: 'value-%s' % name for name in fields}
+    drone = Drone.from_info('drone-X', values)
+    assert {name: getattr(drone, name) for name in fields} == values
+
+    drone = Drone.from_info('drone-X', {})
+    drone.apply(values)
+    assert {name: getattr(drone, name) for name in fields} == values
+
+    drone = Drone.from_info('drone-X', {})
+    drone.update(**values)
+    assert {name: getattr(drone, name) for name in fields} == values
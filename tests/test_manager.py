@@ -0,0 +1,130 @@
+import threading
+import time
+
+import pytest
+
+from drone import Drone
+from manager import DroneManager
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(time, 'monotonic', fake)
+    return fake
+
+
+def telemetry(**overrides):
+    info = {
+        'lat': 35.1234567, 'lon': -80.7654321, 'alt': 120.5, 'speed': 3.0, 'vspeed': 0.0,
+        'height': 40.0, 'description': 'Test drone', 'mac': 'aa:bb:cc:dd:ee:ff', 'rssi': -60,
+    }
+    info.update(overrides)
+    return info
+
+
+def test_cot_state_ignores_rssi_and_gps_jitter():
+    drone = Drone.from_info('drone-TEST', telemetry())
+    state = drone.cot_state()
+
+    drone.apply(telemetry(lat=35.12345671, lon=-80.76543209, alt=120.52, rssi=-72))
+    assert drone.cot_state() == state
+
+    drone.apply(telemetry(lat=35.1235))
+    assert drone.cot_state() != state
+
+
+def test_jitter_only_update_is_not_resent(clock):
+    manager = DroneManager(rate_limit=1.0, inactivity_timeout=60.0)
+    drone = Drone.from_info('drone-TEST', telemetry())
+    manager.update_or_add_drone(drone.id, drone)
+
+    manager.send_updates()
+    assert drone.last_sent_time == 1000.0
+
+    # Only RSSI and sub-decimetre position noise change: skipped
+    clock.now = 1001.5
+    drone.apply(telemetry(lat=35.12345672, rssi=-75))
+    manager.send_updates()
+    assert drone.last_sent_time == 1000.0
+
+    # A real move is sent as soon as the rate limit allows
+    clock.now = 1003.0
+    drone.apply(telemetry(lat=35.1240))
+    manager.send_updates()
+    assert drone.last_sent_time == 1003.0
+
+
+def test_unchanged_drone_is_resent_after_interval(clock):
+    manager = DroneManager(rate_limit=1.0, inactivity_timeout=60.0)
+    drone = Drone.from_info('drone-TEST', telemetry())
+    manager.update_or_add_drone(drone.id, drone)
+    manager.send_updates()
+
+    clock.now += manager.unchanged_resend_interval
+    drone.apply(telemetry(rssi=-75))
+    manager.send_updates()
+    assert drone.last_sent_time == clock.now
+
+
+class BlockingMessenger:
+    """Records sent batches; the first send blocks until released, like a stalled TAK link."""
+
+    def __init__(self):
+        self.batches = []
+        self.release = threading.Event()
+        self.sending = threading.Event()
+
+    def send_cot_batch(self, cot_xmls):
+        self.sending.set()
+        self.release.wait(5)
+        self.batches.append(list(cot_xmls))
+
+
+def test_stalled_link_keeps_only_latest_message_per_uid():
+    messenger = BlockingMessenger()
+    manager = DroneManager(cot_messenger=messenger)
+
+    manager.enqueue_cot('drone-A', b'a1')
+    assert messenger.sending.wait(5)
+    for i in range(2, 50):
+        manager.enqueue_cot('drone-A', b'a%d' % i)
+        manager.enqueue_cot('wardragon-1', b's%d' % i)
+
+    messenger.release.set()
+    manager.close()
+
+    assert messenger.batches == [[b'a1'], [b'a49', b's49']]
+
+
+def test_expiry_heap_stays_bounded_under_eviction(clock):
+    manager = DroneManager(max_drones=3, rate_limit=1.0, inactivity_timeout=60.0)
+    ids = ['drone-%d' % i for i in range(manager.max_drones + 1)]
+
+    for n in range(2000):
+        clock.now += 0.01
+        drone_id = ids[n % len(ids)]
+        drone = manager.drones.get(drone_id)
+        if drone is not None:
+            drone.apply(telemetry())
+        else:
+            manager.update_or_add_drone(drone_id, Drone.from_info(drone_id, telemetry()))
+        if n % 10 == 0:
+            manager.send_updates()
+        assert len(manager._expiry_heap) <= len(manager.drones)
+
+    assert len(manager.drones) == manager.max_drones
+
+    # Everything still ages out once the drones go quiet
+    clock.now += manager.inactivity_timeout + 1
+    manager.send_updates()
+    assert not manager.drones
+    assert not manager._expiry_heap
@@ -23,13 +23,44 @@ SOFTWARE.
 """
 
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+from dataclasses import dataclass, fields
 import configparser
+import functools
 import logging
 import sys
+import time
 
 logger = logging.getLogger(__name__)
 
+# slots=True needs Python 3.10; older interpreters fall back to a regular dataclass
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_SLOTS)
+class AppConfig:
+    """Validated runtime configuration, resolved once from the command line and config file."""
+    zmq_host: str
+    zmq_port: int
+    zmq_status_port: Optional[int]
+    tak_host: str
+    tak_port: Optional[int]
+    tak_protocol: Optional[str]
+    tak_tls_p12: str
+    tak_tls_p12_pass: str
+    tak_tls_skip_verify: bool
+    tak_multicast_addr: str
+    tak_multicast_port: Optional[int]
+    enable_multicast: bool
+    rate_limit: float
+    max_drones: int
+    inactivity_timeout: float
+    tak_multicast_interface: str
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "AppConfig":
+        """Builds an AppConfig from a validated configuration dictionary."""
+        return cls(**{f.name: config.get(f.name) for f in fields(cls)})
+
 def load_config(config_path: str) -> Dict[str, Any]:
     """
     Loads the configuration from the specified INI file.
@@ -42,10 +73,10 @@ def load_config(config_path: str) -> Dict[str, Any]:
         if 'SETTINGS' in config:
             return dict(config['SETTINGS'])
         else:
-            logger.warning(f"No 'SETTINGS' section found in {config_path}. Using empty configuration.")
+            logger.warning("No 'SETTINGS' section found in %s. Using empty configuration.", config_path)
             return {}
     except Exception as e:
-        logger.critical(f"Failed to load configuration file {config_path}: {e}")
+        logger.critical("Failed to load configuration file %s: %s", config_path, e)
         sys.exit(1)
 
 def get_str(value: Optional[Any], default: str = "") -> str:
@@ -73,6 +104,11 @@ def get_float(value: Optional[Any], default: float = 0.0) -> float:
     Safely converts a value to float. If the value is a string containing units (e.g., "7.5 m"),
     it extracts the numeric part before conversion.
     """
+    # Decoded JSON numbers are the common case; skip the string handling for them
+    if type(value) is float:
+        return value
+    if type(value) is int:
+        return float(value)
     if value is None:
         return default
     if isinstance(value, str):
@@ -81,18 +117,18 @@ def get_float(value: Optional[Any], default: float = 0.0) -> float:
         if parts:
             try:
                 numeric_value = float(parts[0])
-                logger.debug(f"Parsed float from string '{value}': {numeric_value}")
+                logger.debug("Parsed float from string '%s': %s", value, numeric_value)
                 return numeric_value
             except ValueError:
-                logger.warning(f"Unable to parse float from string: '{value}'. Using default {default}.")
+                logger.warning("Unable to parse float from string: '%s'. Using default %s.", value, default)
                 return default
         else:
-            logger.warning(f"Empty string provided for float conversion. Using default {default}.")
+            logger.warning("Empty string provided for float conversion. Using default %s.", default)
             return default
     try:
         return float(value)
     except (ValueError, TypeError):
-        logger.warning(f"Invalid float value: {value}. Using default {default}.")
+        logger.warning("Invalid float value: %s. Using default %s.", value, default)
         return default
 
 def get_bool(value: Optional[Any], default: bool = False) -> bool:
@@ -111,6 +147,31 @@ def get_bool(value: Optional[Any], default: bool = False) -> bool:
             return False
     return default
 
+# Single-pass escaping for CoT text and attribute values
+XML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&apos;'})
+
+@functools.lru_cache(maxsize=16)
+def _cot_second(second: int) -> str:
+    """Formats the whole-second part of a CoT timestamp; shared by every message in that second."""
+    tm = time.gmtime(second)
+    return f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+
+def format_cot_time(timestamp: float) -> str:
+    """
+    Formats a Unix timestamp as a CoT time string (e.g. 2024-01-01T12:00:00.000000Z).
+    """
+    second = int(timestamp)
+    return f"{_cot_second(second)}.{int((timestamp - second) * 1000000):06d}Z"
+
+def cot_times(stale_offset: float, now: Optional[float] = None) -> Tuple[str, str]:
+    """
+    Returns the CoT time and stale strings for now and now + stale_offset seconds.
+    Callers sending many messages at once can pass a shared wall-clock `now`.
+    """
+    if now is None:
+        now = time.time()
+    return format_cot_time(now), format_cot_time(now + stale_offset)
+
 def validate_config(config: Dict[str, Any]):
     """
     Validates the configuration dictionary.